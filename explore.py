@@ -1,13 +1,16 @@
 import argparse
-import json
+import asyncio
+import hashlib
 import os
+import signal
 import sys
 import textwrap
-import time
 import shutil
+import sqlite3
 from collections import deque
+from xml.sax.saxutils import escape
 
-import networkx as nx
+import msgspec
 from colorama import Back, Fore, Style, init
 from dotenv import load_dotenv
 import google.generativeai as genai
@@ -22,19 +25,165 @@ load_dotenv()
 DEFAULT_ROOT_CONCEPT = "Creativity"
 DEFAULT_MAX_DEPTH = 10
 SLEEP_DURATION = 0.2  # Small delay for better UX
+PREFETCH_LIMIT = 4  # Visible leaves queried in the background while the user reads
+MAX_CONCURRENT_REQUESTS = 2  # Gemini starts returning 429s beyond this
+MAX_BATCH_SIZE = 8  # Concepts per batched prompt; larger batches get noticeably slower
+GENERATION_TEMPERATURE = 0  # Deterministic output; responses are only cached at 0
+CACHE_PATH = os.path.expanduser("~/.explore_cache.db")
+
+# --- Tree Rendering Styles (composed once; `{}` is the node name) ---
+_LAST_CONN = f"{Fore.CYAN}└── "
+_MID_CONN = f"{Fore.CYAN}├── "
+_NORMAL_FMT = f"{Fore.YELLOW}{Style.NORMAL}{{}}{Style.RESET_ALL}"
+_FOCUS_FMT = f"{Back.BLUE}{Fore.WHITE}{Style.NORMAL}{{}}{Style.RESET_ALL}"
+_LEAF_FMT = f"{Fore.GREEN}{Style.NORMAL}{{}}{Style.RESET_ALL}"
+_ROOT_FMT = f"{Fore.MAGENTA}{Style.BRIGHT}{{}}{Style.RESET_ALL}"
+
+_PROMPT_TMPL = textwrap.dedent("""
+    You are a creative agent that generates unexpected conceptual connections.
+    Your goal is to build a web of ideas spanning diverse intellectual domains.
+
+    Generate 4-5 fascinating and unexpected concepts related to the current concept and the overall path.
+
+    Guidelines:
+    1.  **Intellectual Diversity**: Connect across science, art, philosophy, technology, and culture.
+    2.  **Concise**: Each concept should be 1-5 words.
+    3.  **Surprising**: Avoid obvious associations. Find thought-provoking links.
+    4.  **Context-Aware**: The new concepts must be relevant to BOTH the current concept and the entire path.
+    5.  **Avoid Repeats**: Do not suggest any concepts already in the path or previously seen.
+
+    Return your response as a JSON object with a single key "concepts" which contains a list of strings.
+    Example: {{"concepts": ["Quantum Foam", "Aesthetic Experience", "Cognitive Scaffolding", "Emergent Systems"]}}
+
+    The exploration path so far is: {full_path_str}
+    The current concept to explore is: "{concept}"
+""").strip()
+
+_BATCH_PROMPT_TMPL = textwrap.dedent("""
+    You are a creative agent that generates unexpected conceptual connections.
+    Your goal is to build a web of ideas spanning diverse intellectual domains.
+
+    Explore each of the concepts listed at the end independently; each one is given with its exploration path so far.
+    For EACH concept, generate 4-5 fascinating and unexpected concepts related to it and to its own path.
+
+    Guidelines:
+    1.  **Intellectual Diversity**: Connect across science, art, philosophy, technology, and culture.
+    2.  **Concise**: Each concept should be 1-5 words.
+    3.  **Surprising**: Avoid obvious associations. Find thought-provoking links.
+    4.  **Context-Aware**: The new concepts must be relevant to BOTH the concept being explored and its path.
+    5.  **Avoid Repeats**: Do not suggest any concepts already in a path or previously seen.
+
+    Return your response as a JSON object that maps each concept, spelled exactly as given, to a list of strings.
+    Example: {{"Entropy": ["Quantum Foam", "Aesthetic Experience"], "Jazz": ["Cognitive Scaffolding", "Emergent Systems"]}}
+
+    Concepts to explore:
+    {items}
+""").strip()
+
+# --- GraphML Export (structure only, same layout networkx writes) ---
+_GRAPHML_HEADER = (
+    "<?xml version='1.0' encoding='utf-8'?>\n"
+    '<graphml xmlns="http://graphml.graphdrawing.org/xmlns" '
+    'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+    'xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns '
+    'http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n'
+    '  <graph edgedefault="directed">\n'
+)
+_GRAPHML_FOOTER = "  </graph>\n</graphml>\n"
+_XML_ATTR_ENTITIES = {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#09;"}
+
+def _xml_attr(value: str) -> str:
+    """Escapes a value for a double-quoted XML attribute, the way ElementTree does."""
+    return escape(value, _XML_ATTR_ENTITIES)
+
+# --- Gemini Response Schemas (validated while decoding) ---
+class ConceptsResponse(msgspec.Struct):
+    """Reply to a single-concept prompt; unknown keys are ignored."""
+    concepts: list[str] = []
+
+_CONCEPTS_DECODER = msgspec.json.Decoder(ConceptsResponse)
+_BATCH_DECODER = msgspec.json.Decoder(dict[str, list[str]])
 
 def clear_terminal():
     """Clears the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # Plain ANSI escapes (translated by colorama on Windows) avoid spawning a shell every frame
+    sys.stdout.write("\x1b[H\x1b[2J")
+    sys.stdout.flush()
+
+_stdin_pending = bytearray()  # Bytes read from stdin past the last returned line
+
+async def async_input(prompt: str = "") -> str:
+    """
+    Reads a line from stdin without blocking the event loop.
+    On POSIX the loop watches the stdin descriptor, so no thread is ever left
+    blocked in input() when Ctrl+C ends the session.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    loop = asyncio.get_running_loop()
+    fd = sys.stdin.fileno()
+
+    def _take_line():
+        newline = _stdin_pending.find(b"\n")
+        if newline < 0:
+            return None
+        line = bytes(_stdin_pending[:newline])
+        del _stdin_pending[:newline + 1]
+        return line.decode(sys.stdin.encoding or "utf-8", errors="replace").rstrip("\r")
+
+    line = _take_line()
+    if line is not None:
+        return line
+
+    future = loop.create_future()
+
+    def _on_readable():
+        if future.done():
+            return
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            # EOF: hand back a final unterminated line, as input() would
+            if _stdin_pending:
+                _stdin_pending.append(ord("\n"))
+            else:
+                future.set_exception(EOFError())
+                return
+        _stdin_pending.extend(chunk)
+        line = _take_line()
+        if line is not None:
+            future.set_result(line)
+
+    try:
+        loop.add_reader(fd, _on_readable)
+    except (NotImplementedError, PermissionError):
+        # Windows event loops and regular-file stdin cannot be watched
+        line = await loop.run_in_executor(None, sys.stdin.readline)
+        if not line:
+            raise EOFError
+        return line.rstrip("\r\n")
+    try:
+        return await future
+    finally:
+        loop.remove_reader(fd)
 
 class ConceptExplorer:
     """
     An interactive tool to visually explore conceptual connections using the Gemini API.
     """
     def __init__(self):
-        self.graph = nx.DiGraph()
+        # The concept graph, as plain adjacency dicts keyed by concept name
+        self.children: dict[str, list[str]] = {}
+        self.parents: dict[str, list[str]] = {}  # The root maps to []; the first entry is the primary parent
+        self.lc: dict[str, str] = {}  # Lowercase form of each concept, computed once at insert
+        self.depth: dict[str, int] = {}  # Distance from the root, maintained as nodes are added
         self.seen_concepts = set()
+        self.dirty = True  # Set whenever the graph changes so leaf nodes get rescanned
+        self._leaf_nodes = []
+        self.prefetch: dict[str, asyncio.Task] = {}
+        self.request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
         self.term_width, self.term_height = shutil.get_terminal_size((80, 24))
+        if hasattr(signal, "SIGWINCH"):
+            signal.signal(signal.SIGWINCH, self._on_resize)
         
         # Configure the Gemini client
         api_key = os.getenv("GOOGLE_API_KEY")
@@ -44,74 +193,207 @@ class ConceptExplorer:
             sys.exit(1)
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel('gemini-2.5-flash')
+        self.generation_config = genai.GenerationConfig(
+            response_mime_type="application/json",
+            temperature=GENERATION_TEMPERATURE
+        )
+
+        # Persistent response cache, only meaningful when generation is deterministic
+        self.cache = None
+        if GENERATION_TEMPERATURE == 0:
+            try:
+                self.cache = sqlite3.connect(CACHE_PATH)
+                self.cache.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT)")
+            except sqlite3.Error as e:
+                print(f"{Fore.YELLOW}Response cache disabled: {e}{Style.RESET_ALL}")
+                self.cache = None
 
-    def query_gemini(self, prompt: str) -> str:
+    async def query_gemini(self, prompt: str, decoder: msgspec.json.Decoder, background: bool = False):
         """
-        Queries the Gemini API with a specific prompt, requesting a JSON response.
-        Returns the raw text of the response.
+        Queries the Gemini API with a specific prompt, requesting a JSON response,
+        and returns it decoded with `decoder`. Returns None if the request fails
+        or the reply does not decode; background (prefetch) calls print nothing.
+        Only replies that decode are cached, so a bad reply is retried next time.
         """
-        print(f"{Fore.LIGHTBLACK_EX} 🧠 Thinking with Gemini...{Style.RESET_ALL}", end="\r")
+        key = hashlib.sha256(f"{self.model.model_name}\n{prompt}".encode('utf-8')).hexdigest()
+        if self.cache is not None:
+            row = self.cache.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row:
+                try:
+                    return decoder.decode(row[0])
+                except msgspec.DecodeError:
+                    pass  # Stale entry from an older schema; fetch a fresh reply
+
+        if not background:
+            print(f"{Fore.LIGHTBLACK_EX} 🧠 Thinking with Gemini...{Style.RESET_ALL}", end="\r")
         try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config=genai.GenerationConfig(
-                    response_mime_type="application/json"
+            async with self.request_slots:
+                response = await self.model.generate_content_async(
+                    prompt,
+                    generation_config=self.generation_config
                 )
-            )
-            sys.stdout.write("\033[K")  # Clear the "Thinking..." line
-            return response.text
+            response_text = response.text
         except Exception as e:
-            sys.stdout.write("\033[K")
-            print(f"{Fore.RED}Error querying Gemini API: {e}{Style.RESET_ALL}")
-            return '{"concepts": []}'
+            if not background:
+                sys.stdout.write("\033[K")
+                print(f"{Fore.RED}Error querying Gemini API: {e}{Style.RESET_ALL}")
+            return None
+        if not background:
+            sys.stdout.write("\033[K")  # Clear the "Thinking..." line
 
-    def get_related_concepts(self, concept: str, path: list) -> list:
+        try:
+            data = decoder.decode(response_text)
+        except msgspec.DecodeError:
+            if not background:
+                print(f"{Fore.RED}✗ Could not parse JSON from Gemini response.{Style.RESET_ALL}")
+            return None
+        if self.cache is not None:
+            with self.cache:
+                self.cache.execute("INSERT OR REPLACE INTO responses VALUES (?, ?)", (key, response_text))
+        return data
+
+    def build_prompt(self, concept: str, path: list) -> str:
         """
-        Generates a prompt and queries Gemini for related concepts.
+        Builds the Gemini prompt asking for concepts related to `concept`.
+        `path` runs from the root up to and including `concept`.
         """
-        self.seen_concepts.add(concept.lower())
-        full_path_str = ' → '.join(path + [concept])
-
-        prompt = textwrap.dedent(f"""
-            You are a creative agent that generates unexpected conceptual connections.
-            Your goal is to build a web of ideas spanning diverse intellectual domains.
-
-            The exploration path so far is: {full_path_str}
-            The current concept to explore is: "{concept}"
-
-            Generate 4-5 fascinating and unexpected concepts related to the current concept and the overall path.
+        full_path_str = ' → '.join(path)
+        return _PROMPT_TMPL.format(full_path_str=full_path_str, concept=concept)
+
+    def path_to(self, node: str) -> list:
+        """Returns the path from the root to `node` by walking parent pointers."""
+        path = []
+        while node is not None:
+            path.append(node)
+            parents = self.parents[node]
+            node = parents[0] if parents else None
+        path.reverse()
+        return path
+
+    def build_batch_prompt(self, concepts: list, paths: dict) -> str:
+        """Builds one Gemini prompt that expands several concepts at once."""
+        items = "\n".join(f'- "{c}" (path: {" → ".join(paths[c])})' for c in concepts)
+        return _BATCH_PROMPT_TMPL.format(items=items)
+
+    async def _fetch_related_batch(self, concepts: list, paths: dict, background: bool = True) -> dict | None:
+        """
+        Expands `concepts` with a single Gemini call. Returns the raw lists
+        keyed by concept, or None if the request or its JSON failed.
+        """
+        data = await self.query_gemini(self.build_batch_prompt(concepts, paths), _BATCH_DECODER, background)
+        if data is None:
+            return None
+
+        # Match keys loosely; the model does not always echo capitalization exactly
+        by_lower = {c.lower(): c for c in concepts}
+        results = {}
+        for key, related in data.items():
+            concept = by_lower.get(key.strip().lower())
+            if concept is not None:
+                results[concept] = related
+        return results
+
+    def prefetch_leaves(self, leaf_nodes: list):
+        """Starts one batched background query for the first few visible leaves."""
+        pending = [n for n in leaf_nodes[:PREFETCH_LIMIT] if n not in self.prefetch]
+        if not pending:
+            return
+        paths = {n: self.path_to(n) for n in pending}
+        task = asyncio.create_task(self._fetch_related_batch(pending, paths))
+        for node in pending:
+            self.prefetch[node] = task
+
+    def cancel_prefetch(self, nodes):
+        """Drops background queries for concepts that are no longer leaves."""
+        for node in nodes:
+            task = self.prefetch.pop(node, None)
+            # A batch task is shared; only cancel it once no leaf is waiting on it
+            if task is not None and task not in self.prefetch.values():
+                task.cancel()
+
+    async def _take_prefetched(self, concept: str) -> list | None:
+        """Returns the prefetched concepts for `concept`, or None if there are none."""
+        task = self.prefetch.pop(concept, None)
+        if task is None:
+            return None
+        if not task.done():
+            print(f"{Fore.LIGHTBLACK_EX} 🧠 Thinking with Gemini...{Style.RESET_ALL}", end="\r")
+        results = await task
+        sys.stdout.write("\033[K")
+        return results.get(concept) if results else None
+
+    def _filter_new(self, related_concepts: list, taken: set) -> list:
+        """Drops blanks and concepts already explored or already taken in this batch."""
+        filtered = []
+        for rc in related_concepts:
+            lc = rc.lower()
+            if rc.strip() and lc not in self.seen_concepts and lc not in taken:
+                taken.add(lc)
+                filtered.append(rc)
+        return filtered
+
+    async def get_related_concepts(self, concept: str, path: list) -> list:
+        """
+        Queries Gemini for related concepts, reusing a prefetched response if one exists.
+        """
+        self.seen_concepts.add(self.lc[concept])
 
-            Guidelines:
-            1.  **Intellectual Diversity**: Connect across science, art, philosophy, technology, and culture.
-            2.  **Concise**: Each concept should be 1-5 words.
-            3.  **Surprising**: Avoid obvious associations. Find thought-provoking links.
-            4.  **Context-Aware**: The new concepts must be relevant to BOTH the immediate concept ("{concept}") and the entire path.
-            5.  **Avoid Repeats**: Do not suggest any concepts already in the path or previously seen.
+        related_concepts = await self._take_prefetched(concept)
+        if related_concepts is None:
+            data = await self.query_gemini(self.build_prompt(concept, path), _CONCEPTS_DECODER)
+            if data is None:
+                return []
+            related_concepts = data.concepts
 
-            Return your response as a JSON object with a single key "concepts" which contains a list of strings.
-            Example: {{"concepts": ["Quantum Foam", "Aesthetic Experience", "Cognitive Scaffolding", "Emergent Systems"]}}
-        """).strip()
+        filtered = self._filter_new(related_concepts, set())
+        print(f"{Fore.GREEN}✓ Found {len(filtered)} new concepts.{Style.RESET_ALL}")
+        return filtered
 
-        response_text = self.query_gemini(prompt)
-        
-        try:
-            data = json.loads(response_text)
-            related_concepts = data.get("concepts", [])
-            
-            filtered = [
-                rc for rc in related_concepts 
-                if rc.strip() and rc.lower() not in self.seen_concepts
-            ]
-            print(f"{Fore.GREEN}✓ Found {len(filtered)} new concepts.{Style.RESET_ALL}")
-            return filtered
-        except json.JSONDecodeError:
-            print(f"{Fore.RED}✗ Could not parse JSON from Gemini response.{Style.RESET_ALL}")
-            return []
+    async def get_related_concepts_batch(self, concepts: list, paths: dict) -> dict:
+        """
+        Expands several concepts, reusing prefetched responses and sending
+        whatever is left to Gemini as a single batched prompt.
+        """
+        for concept in concepts:
+            self.seen_concepts.add(self.lc[concept])
+
+        results = {}
+        for concept in concepts:
+            prefetched = await self._take_prefetched(concept)
+            if prefetched is not None:
+                results[concept] = prefetched
+
+        missing = [c for c in concepts if c not in results]
+        if missing:
+            results.update(await self._fetch_related_batch(missing, paths, background=False) or {})
+
+        taken = set()
+        filtered = {c: self._filter_new(results.get(c, []), taken) for c in concepts}
+        total = sum(len(f) for f in filtered.values())
+        print(f"{Fore.GREEN}✓ Found {total} new concepts across {len(concepts)} branches.{Style.RESET_ALL}")
+        return filtered
+
+    def add_concepts(self, parent: str, related_concepts: list):
+        """Attaches newly found concepts to `parent` and records their depth."""
+        for rel_concept in related_concepts:
+            if rel_concept not in self.children:
+                self.children[rel_concept] = []
+                self.parents[rel_concept] = []
+                self.lc[rel_concept] = rel_concept.lower()
+            if parent not in self.parents[rel_concept]:
+                self.children[parent].append(rel_concept)
+                self.parents[rel_concept].append(parent)
+            child_depth = self.depth[parent] + 1
+            self.depth[rel_concept] = min(self.depth.get(rel_concept, child_depth), child_depth)
+            self.dirty = True
+
+    def _on_resize(self, signum, frame):
+        """Refreshes the cached terminal size when the window changes."""
+        self.term_width, self.term_height = shutil.get_terminal_size((80, 24))
 
     def display_ui(self, focus_node=None, leaf_nodes=None):
         """Clears the screen and renders the complete user interface."""
         clear_terminal()
-        self.term_width, self.term_height = shutil.get_terminal_size((80, 24))
 
         # --- Header ---
         print(f"{Fore.GREEN}🌳 {Fore.YELLOW}GEMINI CONCEPT EXPLORER {Fore.GREEN}🌳")
@@ -123,7 +405,7 @@ class ConceptExplorer:
 
         # --- Footer & Stats ---
         print(f"\n{Fore.CYAN}{'═' * min(50, self.term_width - 2)}{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}📊 Concepts: {len(self.graph.nodes)} | Connections: {len(self.graph.edges)}{Style.RESET_ALL}")
+        print(f"{Fore.YELLOW}📊 Concepts: {len(self.children)} | Connections: {sum(len(kids) for kids in self.children.values())}{Style.RESET_ALL}")
         
         # --- Interactive Prompt ---
         if leaf_nodes:
@@ -131,11 +413,11 @@ class ConceptExplorer:
             for i, node in enumerate(leaf_nodes, 1):
                 print(f"  {Fore.CYAN}[{i}]{Style.RESET_ALL} {node}")
         
-        print(f"\n{Fore.YELLOW}Commands: {Style.RESET_ALL}prune [name], save, exit")
+        print(f"\n{Fore.YELLOW}Commands: {Style.RESET_ALL}explore [N], prune [name], save, exit")
 
     def generate_ascii_tree(self, focus_node=None) -> str:
-        """Recursively generates a colorful ASCII tree representation of the graph."""
-        roots = [n for n in self.graph.nodes if self.graph.in_degree(n) == 0]
+        """Generates a colorful ASCII tree representation of the graph."""
+        roots = [n for n, ps in self.parents.items() if not ps]
         if not roots:
             return f"{Fore.RED}Graph is empty.{Style.RESET_ALL}"
 
@@ -143,65 +425,82 @@ class ConceptExplorer:
         
         # Determine the path to the focused node to keep it in view
         path_to_focus = []
-        if focus_node and focus_node in self.graph:
-            path_to_focus = list(reversed(list(nx.ancestors(self.graph, focus_node)))) + [focus_node]
-
-        def _build_tree_recursive(node, prefix="", is_last=True, visited=None):
-            if visited is None: visited = set()
-            if node in visited: return
+        if focus_node and focus_node in self.children:
+            path_to_focus = set(self.path_to(focus_node))
+
+        # Iterative DFS: children are pushed in reverse so they pop in order
+        visited = set()
+        stack = [(roots[0], "", True)]
+        while stack:
+            node, prefix, is_last = stack.pop()
+            connector = _LAST_CONN if is_last else _MID_CONN
+            # Each node is drawn once, under its first parent; later parents
+            # get a "(...)" reference, matching the plain-text export
+            if node in visited:
+                tree_lines.append(prefix + connector + _NORMAL_FMT.format(f"{node} (...)"))
+                continue
             visited.add(node)
             
             # --- Node Coloring ---
-            connector = "└── " if is_last else "├── "
-            color = Fore.YELLOW
-            style = Style.NORMAL
+            node_fmt = _NORMAL_FMT
             if node == focus_node:
-                color = Back.BLUE + Fore.WHITE
-            elif self.graph.out_degree(node) == 0 and self.graph.in_degree(node) > 0:
-                color = Fore.GREEN # Leaf node
-            elif self.graph.in_degree(node) == 0:
-                color = Fore.MAGENTA # Root node
-                style = Style.BRIGHT
-
-            tree_lines.append(f"{prefix}{Fore.CYAN}{connector}{color}{style}{node}{Style.RESET_ALL}")
+                node_fmt = _FOCUS_FMT
+            elif not self.children[node] and self.parents[node]:
+                node_fmt = _LEAF_FMT # Leaf node
+            elif not self.parents[node]:
+                node_fmt = _ROOT_FMT # Root node
+
+            tree_lines.append(prefix + connector + node_fmt.format(node))
             
-            children = list(self.graph.successors(node))
+            children = self.children[node]
             # If there's a focus path, prioritize drawing it
             if path_to_focus:
-                children.sort(key=lambda x: x not in path_to_focus)
+                children = sorted(children, key=lambda x: x not in path_to_focus)
 
             next_prefix = prefix + ("    " if is_last else "│   ")
-            for i, child in enumerate(children):
-                _build_tree_recursive(child, next_prefix, i == len(children) - 1, visited.copy())
+            last = len(children) - 1
+            for i in range(last, -1, -1):
+                stack.append((children[i], next_prefix, i == last))
 
-        _build_tree_recursive(roots[0])
         return "\n".join(tree_lines)
     
-    def prune_branch(self, node_to_prune: str):
+    async def prune_branch(self, node_to_prune: str):
         """Removes a node and all its descendants from the graph."""
-        if node_to_prune not in self.graph:
+        if node_to_prune not in self.children:
             print(f"{Fore.RED}Concept '{node_to_prune}' not found.{Style.RESET_ALL}")
-            time.sleep(1.5)
+            await asyncio.sleep(1.5)
             return
 
-        try:
-            descendants = nx.descendants(self.graph, node_to_prune)
-            nodes_to_remove = {node_to_prune} | descendants
-            self.graph.remove_nodes_from(nodes_to_remove)
+        # Collect the branch with a BFS over the adjacency lists
+        nodes_to_remove = {node_to_prune}
+        queue = deque([node_to_prune])
+        while queue:
+            for child in self.children[queue.popleft()]:
+                if child not in nodes_to_remove:
+                    nodes_to_remove.add(child)
+                    queue.append(child)
+
+        # Unlink the branch from parents that survive the prune
+        for node in nodes_to_remove:
+            for pred in self.parents[node]:
+                if pred not in nodes_to_remove:
+                    self.children[pred].remove(node)
+
+        # Clean up the seen_concepts set as well
+        for node in nodes_to_remove:
+            self.seen_concepts.discard(self.lc.pop(node))
+            self.depth.pop(node, None)
+            self.parents.pop(node, None)
+            self.children.pop(node, None)
+        self.dirty = True
+        self.cancel_prefetch(nodes_to_remove)
             
-            # Clean up the seen_concepts set as well
-            for node in nodes_to_remove:
-                self.seen_concepts.discard(node.lower())
-                
-            print(f"{Fore.YELLOW}Pruned branch starting from '{node_to_prune}'.{Style.RESET_ALL}")
-            time.sleep(1)
-        except nx.NetworkXError:
-            print(f"{Fore.RED}Could not find concept '{node_to_prune}' to prune.{Style.RESET_ALL}")
-            time.sleep(1.5)
+        print(f"{Fore.YELLOW}Pruned branch starting from '{node_to_prune}'.{Style.RESET_ALL}")
+        await asyncio.sleep(1)
 
     def save_files(self, root_concept: str):
         """Exports the graph to both a plain text ASCII file and a GraphML file."""
-        if not self.graph:
+        if not self.children:
             print(f"{Fore.YELLOW}Graph is empty, nothing to save.{Style.RESET_ALL}")
             return
             
@@ -209,63 +508,82 @@ class ConceptExplorer:
         
         # 1. Export ASCII Tree
         ascii_filename = f"{filename_base}_tree.txt"
-        plain_tree = self.generate_ascii_tree().encode('utf-8', 'ignore').decode('utf-8')
-        # Simple regex to strip ANSI color codes for plain text file
-        plain_tree = '\n'.join([s.split(' ')[-1] for s in plain_tree.split('\n')])
         
-        def _plain_ascii_tree(node, prefix="", is_last=True, visited=None):
-            if visited is None: visited = set()
-            if node in visited: return f"{prefix}{'└── ' if is_last else '├── '}{node} (...)\n"
+        roots = [n for n, ps in self.parents.items() if not ps]
+        buf = []
+        # Iterative DFS with one shared visited set; a node reached a second time
+        # (a concept with two parents) is written once more as a "(...)" reference
+        visited = set()
+        stack = [(roots[0], "", True)]
+        while stack:
+            node, prefix, is_last = stack.pop()
+            connector = '└── ' if is_last else '├── '
+            if node in visited:
+                buf.append(f"{prefix}{connector}{node} (...)\n")
+                continue
             visited.add(node)
-            result = f"{prefix}{'└── ' if is_last else '├── '}{node}\n"
-            children = list(self.graph.successors(node))
-            if not children: return result
+            buf.append(f"{prefix}{connector}{node}\n")
+            children = self.children[node]
             next_prefix = prefix + ("    " if is_last else "│   ")
-            for i, child in enumerate(children):
-                is_last_child = (i == len(children) - 1)
-                result += _plain_ascii_tree(child, next_prefix, is_last_child, visited.copy())
-            return result
-        
-        roots = [n for n in self.graph.nodes if self.graph.in_degree(n) == 0]
-        tree_text = _plain_ascii_tree(roots[0])
+            last = len(children) - 1
+            for i in range(last, -1, -1):
+                stack.append((children[i], next_prefix, i == last))
+        tree_text = ''.join(buf)
         with open(ascii_filename, 'w', encoding='utf-8') as f:
             f.write(tree_text)
         print(f"{Fore.GREEN}📝 Plain text tree saved to {ascii_filename}{Style.RESET_ALL}")
 
-        # 2. Export GraphML for professional tools
+        # 2. Export GraphML for professional tools, streamed straight from the
+        # adjacency lists (no export graph copy, no in-memory XML tree)
         graphml_filename = f"{filename_base}_graph.graphml"
-        nx.write_graphml(self.graph, graphml_filename)
+        with open(graphml_filename, 'w', encoding='utf-8') as f:
+            f.write(_GRAPHML_HEADER)
+            for node in self.children:
+                f.write(f'    <node id="{_xml_attr(node)}" />\n')
+            for parent, kids in self.children.items():
+                for child in kids:
+                    f.write(f'    <edge source="{_xml_attr(parent)}" target="{_xml_attr(child)}" />\n')
+            f.write(_GRAPHML_FOOTER)
         print(f"{Fore.GREEN}📊 GraphML file saved to {graphml_filename} (open with Gephi/Cytoscape){Style.RESET_ALL}")
 
-    def run_exploration(self, root_concept: str, max_depth: int):
+    async def run_exploration(self, root_concept: str, max_depth: int):
         """The main interactive exploration loop."""
-        self.graph.add_node(root_concept)
+        self.children = {root_concept: []}
+        self.parents = {root_concept: []}
+        self.lc = {root_concept: root_concept.lower()}
+        self.depth = {root_concept: 0}
+        self.dirty = True
         
         current_focus = root_concept
         path_to_current = {root_concept: []}
 
         while True:
             # Find all nodes that can be explored (leaf nodes)
-            leaf_nodes = [n for n in self.graph.nodes if self.graph.out_degree(n) == 0 and nx.shortest_path_length(self.graph, root_concept, n) < max_depth]
+            # (rescanned only after the graph changed; save and invalid input reuse the list)
+            if self.dirty:
+                self._leaf_nodes = [n for n, kids in self.children.items() if not kids and self.depth.get(n, 0) < max_depth]
+                self.dirty = False
+            leaf_nodes = self._leaf_nodes
             
             self.display_ui(current_focus, leaf_nodes)
+            self.prefetch_leaves(leaf_nodes)
 
             if not leaf_nodes:
                 print(f"\n{Fore.GREEN}🎉 No more concepts to explore (or max depth reached). Exploration complete!{Style.RESET_ALL}")
                 break
 
             try:
-                user_input = input(f"{Style.BRIGHT}> {Style.RESET_ALL}").strip()
+                user_input = (await async_input(f"{Style.BRIGHT}> {Style.RESET_ALL}")).strip()
                 
                 if user_input.lower() == 'exit':
                     break
                 elif user_input.lower() == 'save':
                     self.save_files(root_concept)
-                    time.sleep(2)
+                    await asyncio.sleep(2)
                     continue
                 elif user_input.lower().startswith('prune '):
                     node_to_prune = user_input[6:].strip()
-                    self.prune_branch(node_to_prune)
+                    await self.prune_branch(node_to_prune)
                     current_focus = root_concept # Reset focus after pruning
                     continue
                 elif user_input.isdigit() and 1 <= int(user_input) <= len(leaf_nodes):
@@ -274,24 +592,34 @@ class ConceptExplorer:
                     current_focus = concept_to_explore
                     
                     # Get new concepts from Gemini
-                    path = nx.shortest_path(self.graph, source=root_concept, target=concept_to_explore)
-                    related_concepts = self.get_related_concepts(concept_to_explore, path)
+                    path = self.path_to(concept_to_explore)
+                    related_concepts = await self.get_related_concepts(concept_to_explore, path)
 
                     # Add new concepts to the graph
-                    for rel_concept in related_concepts:
-                        if rel_concept not in self.graph:
-                            self.graph.add_node(rel_concept)
-                        self.graph.add_edge(concept_to_explore, rel_concept)
+                    self.add_concepts(concept_to_explore, related_concepts)
                     
-                    time.sleep(SLEEP_DURATION)
+                    await asyncio.sleep(SLEEP_DURATION)
+                elif user_input.lower().startswith('explore ') and user_input[8:].strip().isdigit() and int(user_input[8:]) > 0:
+                    # Expand the first N listed concepts with one batched request
+                    concepts_to_explore = leaf_nodes[:min(int(user_input[8:]), MAX_BATCH_SIZE)]
+                    paths = {c: self.path_to(c) for c in concepts_to_explore}
+                    related_by_concept = await self.get_related_concepts_batch(concepts_to_explore, paths)
+                    for concept, related_concepts in related_by_concept.items():
+                        self.add_concepts(concept, related_concepts)
+                    current_focus = concepts_to_explore[0]
+
+                    await asyncio.sleep(SLEEP_DURATION)
                 else:
                     print(f"{Fore.RED}Invalid command. Please enter a number from the list or a valid command.{Style.RESET_ALL}")
-                    time.sleep(1.5)
+                    await asyncio.sleep(1.5)
 
-            except KeyboardInterrupt:
-                break # Exit loop on Ctrl+C
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                break # Exit loop on Ctrl+C (asyncio.run delivers it as a cancellation)
 
         # --- Cleanup and Save ---
+        self.cancel_prefetch(list(self.prefetch))
+        if self.cache is not None:
+            self.cache.close()
         print(f"\n{Fore.YELLOW}Exploration ended.{Style.RESET_ALL}")
         self.save_files(root_concept)
 
@@ -316,10 +644,13 @@ def main():
 
     try:
         explorer = ConceptExplorer()
-        explorer.run_exploration(args.root, args.depth)
+        asyncio.run(explorer.run_exploration(args.root, args.depth))
     except SystemExit as e:
         # Intercept sys.exit from API key check
         pass
+    except KeyboardInterrupt:
+        # asyncio.run re-raises Ctrl+C once the exploration has been saved
+        pass
     except Exception as e:
         print(f"\n{Fore.RED}An unexpected error occurred: {e}{Style.RESET_ALL}")
     finally: